@@ -2,35 +2,57 @@
 """Analyze HTML structure of Fischerinsel page."""
 
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree, html as lxml_html
 import json
 
 url = 'https://www.berlinerbaeder.de/baeder/detail/schwimmhalle-fischerinsel/'
+MAX_BYTES = 2 * 1024 * 1024  # Obergrenze für den Seiteninhalt
+
+# Erstes Element, dessen eigener Text das Keyword enthält (einmal kompiliert)
+FIRST_ELEMENT_WITH_TEXT = etree.XPath('(//*[text()[contains(., $kw)]])[1]')
+
 print(f"Fetching {url}...")
-resp = requests.get(url, timeout=10)
-resp.encoding = resp.apparent_encoding
-soup = BeautifulSoup(resp.text, 'html.parser')
+# Body gestreamt als Bytes einlesen; lxml dekodiert mit dem Charset aus dem
+# Content-Type (ohne Angabe UTF-8, wie scrape_pools.fetch_page)
+with requests.get(url, timeout=10, stream=True) as resp:
+    resp.raise_for_status()
+    if 'charset' in resp.headers.get('Content-Type', '').lower():
+        encoding = resp.encoding
+    else:
+        encoding = 'utf-8'
+    buf = bytearray()
+    for chunk in resp.iter_content(chunk_size=65536):
+        buf += chunk
+        if len(buf) >= MAX_BYTES:
+            break
+tree = lxml_html.fromstring(bytes(buf[:MAX_BYTES]), parser=lxml_html.HTMLParser(encoding=encoding))
 
 print("\n=== SAVING RAW HTML SNIPPET ===\n")
 
+# Textindex der Seite einmal aufbauen: Keywords, die gar nicht vorkommen,
+# werden per str.find aussortiert, ohne den Baum abzulaufen
+page_text = tree.text_content()
+
 # Finde die Öffnungszeiten Sektion
 keywords = ['Öffnungszeiten', 'Montag', 'öffentl']
 for kw in keywords:
-    elem = soup.find(string=lambda s: s and kw in s)
-    if elem:
+    if page_text.find(kw) < 0:
+        continue
+    found = FIRST_ELEMENT_WITH_TEXT(tree, kw=kw)
+    if found:
         print(f"\nFound '{kw}':")
         
         # Gehe nach oben bis zur Tabelle oder Struktur
-        parent = elem.parent
+        parent = found[0]
         for i in range(10):
-            if parent and parent.name in ['table', 'section', 'article', 'div']:
+            if parent is not None and parent.tag in ['table', 'section', 'article', 'div']:
                 break
-            parent = parent.parent
+            parent = parent.getparent()
         
-        if parent:
+        if parent is not None:
             # Speichere HTML snippet
-            html_str = str(parent)
-            print(f"Parent: {parent.name}, class={parent.get('class')}")
+            html_str = lxml_html.tostring(parent, encoding='unicode', with_tail=False)
+            print(f"Parent: {parent.tag}, class={parent.get('class')}")
             print(f"HTML length: {len(html_str)} chars")
             print("\nFirst 2000 chars:")
             print(html_str[:2000])
@@ -44,18 +66,18 @@ for kw in keywords:
 # Detaillierte Tabellen-Analyse
 print("\n\n=== DETAILED TABLE ANALYSIS ===\n")
 
-tables = soup.find_all('table')
+tables = tree.xpath('//table')
 print(f"Found {len(tables)} tables")
 
 for i, table in enumerate(tables):
     print(f"\n--- Table {i} ---")
-    rows = table.find_all('tr')
+    rows = table.xpath('.//tr')
     print(f"Rows: {len(rows)}")
     
     # Schaue alle Zeilen
     for j, row in enumerate(rows[:15]):  # Nur erste 15
-        cells = row.find_all(['td', 'th'])
-        row_text = " | ".join(c.get_text(strip=True)[:30] for c in cells)
+        cells = row.xpath('.//th|.//td')
+        row_text = " | ".join(c.text_content().strip()[:30] for c in cells)
         print(f"  Row {j}: {row_text}")
 
 print("\n✅ Analysis complete")
@@ -1,39 +1,51 @@
 import requests
-from bs4 import BeautifulSoup
+from lxml import html as lxml_html
 import json
 
 url = "https://www.berlinerbaeder.de/baeder/detail/schwimmhalle-fischerinsel/"
+MAX_BYTES = 2 * 1024 * 1024  # Obergrenze für den Seiteninhalt
 
 try:
-    response = requests.get(url, timeout=10)
-    response.encoding = 'utf-8'
-    html = response.text
+    # Body gestreamt als Bytes lesen, ohne Dekodierung zu str; lxml dekodiert
+    # mit dem Charset aus dem Content-Type (ohne Angabe UTF-8)
+    with requests.get(url, timeout=10, stream=True) as response:
+        response.raise_for_status()
+        if 'charset' in response.headers.get('Content-Type', '').lower():
+            encoding = response.encoding
+        else:
+            encoding = 'utf-8'
+        buf = bytearray()
+        for chunk in response.iter_content(chunk_size=65536):
+            buf += chunk
+            if len(buf) >= MAX_BYTES:
+                break
+    html = bytes(buf[:MAX_BYTES])
     
     # Speichere HTML zum Debugging
-    with open('/workspaces/BBB/pool_page.html', 'w', encoding='utf-8') as f:
+    with open('/workspaces/BBB/pool_page.html', 'wb') as f:
         f.write(html)
     
-    soup = BeautifulSoup(html, 'html.parser')
+    tree = lxml_html.fromstring(html, parser=lxml_html.HTMLParser(encoding=encoding))
     
     # Finde alle Tabellen
-    tables = soup.find_all('table')
+    tables = tree.xpath('//table')
     print(f"Gefundene Tabellen: {len(tables)}\n")
     
     # Analysiere jede Tabelle
     for i, table in enumerate(tables):
         print(f"=== TABELLE {i} ===")
-        print(f"Tabellen-Klassen: {table.get('class', [])}\n")
+        print(f"Tabellen-Klassen: {table.get('class', '')}\n")
         
         # Zeige Struktur
         print("HTML-Struktur der ersten 10 Reihen:")
-        rows = table.find_all('tr')
+        rows = table.xpath('.//tr')
         for j, row in enumerate(rows[:10]):
             print(f"\nRow {j}:")
-            cells = row.find_all(['th', 'td'])
+            cells = row.xpath('.//th|.//td')
             for k, cell in enumerate(cells):
-                classes = cell.get('class', [])
-                text = cell.get_text(strip=True)[:100]
-                print(f"  Cell {k}: tag={cell.name}, class={classes}, text='{text}'")
+                classes = cell.get('class', '')
+                text = cell.text_content().strip()[:100]
+                print(f"  Cell {k}: tag={cell.tag}, class={classes}, text='{text}'")
         
         print(f"\nGesamt Reihen: {len(rows)}\n")
         print("=" * 60 + "\n")
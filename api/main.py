@@ -1,32 +1,108 @@
 from __future__ import annotations
 
-import json
+import gzip
+import mmap
+import os
 from pathlib import Path
-from typing import Any
 
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import Response
+import orjson
 
 APP = FastAPI(title="Berliner Bäder API")
 
 DATA_FILE = Path(__file__).resolve().parents[1] / "data" / "pools.json"
 
 
-@APP.get("/api/pools")
-def get_pools() -> Any:
-    """Return cached pools JSON. Do not trigger scraping here."""
-    if not DATA_FILE.exists():
-        raise HTTPException(status_code=503, detail="Data not available: pools.json missing")
+# (mtime_ns, size) stamp of pools.json, its validated bytes, their gzip encoding
+# and the ETag derived from the stamp
+_CACHE: tuple[tuple[int, int], bytes, bytes, str] | None = None
+
+
+def _load_pools_body() -> tuple[bytes, bytes, str]:
+    """Return the raw and gzipped pools.json bytes and their ETag, re-reading only when the file changed."""
+    global _CACHE
+    # Stamp the file actually opened: stat() and open() could see different files
+    # across a rename, caching the new body under the old stamp
     try:
-        with DATA_FILE.open("r", encoding="utf-8") as f:
-            data = json.load(f)
-    except json.JSONDecodeError:
-        raise HTTPException(status_code=502, detail="Data corrupted: invalid JSON")
+        f = DATA_FILE.open("rb")
+    except FileNotFoundError:
+        raise HTTPException(status_code=503, detail="Data not available: pools.json missing")
+    with f:
+        st = os.fstat(f.fileno())
+        stamp = (st.st_mtime_ns, st.st_size)
+        if _CACHE is not None and _CACHE[0] == stamp:
+            return _CACHE[1], _CACHE[2], _CACHE[3]
+
+        # Validate straight from the page-cache mapping; only the copy we serve is materialised.
+        # The map is closed right away: the writers swap in a new pools.json by rename, and a
+        # mapping kept open would pin the replaced file (and SIGBUS if it were ever truncated).
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                data = orjson.loads(memoryview(mm))
+                body = mm[:]
+        except ValueError:  # orjson.JSONDecodeError, or mmap on an empty file
+            raise HTTPException(status_code=502, detail="Data corrupted: invalid JSON")
 
     if not isinstance(data, list):
         raise HTTPException(status_code=502, detail="Data corrupted: expected list")
 
-    return JSONResponse(content=data)
+    # The file stays indented for readable diffs; compressed once per change, the
+    # indentation costs next to nothing on the wire
+    gz_body = gzip.compress(body, compresslevel=6, mtime=0)
+    etag = f'"{st.st_mtime_ns:x}-{st.st_size:x}"'
+    _CACHE = (stamp, body, gz_body, etag)
+    return body, gz_body, etag
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison (RFC 9110) of If-None-Match against etag; "*" matches any."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """True if Accept-Encoding allows gzip (by name or via "*") with a q-value above 0."""
+    gzip_q = star_q = None
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if coding in ("gzip", "x-gzip"):
+            gzip_q = q
+        elif coding == "*":
+            star_q = q
+    if gzip_q is not None:
+        return gzip_q > 0
+    return star_q is not None and star_q > 0
+
+
+@APP.get("/api/pools")
+async def get_pools(request: Request) -> Response:
+    """Return cached pools JSON. Do not trigger scraping here."""
+    body, gz_body, etag = _load_pools_body()
+    use_gzip = _accepts_gzip(request.headers.get("accept-encoding", ""))
+    if use_gzip:
+        # The gzip representation gets its own (weak) validator, as nginx does it
+        etag = f"W/{etag}"
+    headers = {"ETag": etag, "Vary": "Accept-Encoding"}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    if use_gzip:
+        headers["Content-Encoding"] = "gzip"
+        body = gz_body
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 if __name__ == "__main__":
@@ -2,101 +2,176 @@
 """
 Super-strict data cleaning: Extract ONLY complete, non-redundant time entries.
 Pattern: "HH:MM - HH:MM Uhr DESCRIPTION" (one per line, no duplicates)
+
+Pipeline per day: normalize -> extract_times -> dedup.
+pools.json is read and written exactly once per run.
 """
-import json
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from collections import OrderedDict
 
-data_path = Path("/workspaces/BBB/data/pools.json")
+import orjson
 
-# Load current data
-with open(data_path, "r", encoding="utf-8") as f:
-    pools = json.load(f)
+DATA_PATH = Path(__file__).resolve().parent / "data" / "pools.json"
 
 WEEKDAYS = ["Montag", "Dienstag", "Mittwoch", "Donnerstag", "Freitag", "Samstag", "Sonntag"]
+_WEEKDAY_ALT = "|".join(WEEKDAYS)
+# Spelling as found (Montag / montag / MONTAG) -> the WEEKDAYS string itself, so the
+# common spellings need no .lower() and later lookups by day hit on identity
+_DAY_NAMES = {spelling: d for d in WEEKDAYS for spelling in (d, d.lower(), d.upper())}
+
+MAX_ENTRY_LENGTH = 120
+# Below this many pools, worker start-up costs more than the regex work it spreads
+PARALLEL_MIN_POOLS = 64
+
+# Compiled once at import instead of per entry
+# Single sweep: "HH:MM-HH:MM" / "HH:MM – HH:MM" -> "HH:MM - HH:MM", whitespace runs -> " "
+_NORMALIZE_RE = re.compile(r'(\d{1,2}:\d{2})\s*[–—-]\s*(?=\d{1,2}:\d{2})|\s+')
+_DAY_BOUNDARY = rf'\b(?:{_WEEKDAY_ALT})\b'
+# All interesting tokens in one pass, routed on m.lastgroup:
+#   day    - a weekday name; text up to the next one belongs to that day
+#   time   - "HH:MM - HH:MM Uhr DESCRIPTION"; "Uhr" may be missing (it is
+#            added on output), the description runs up to the next time
+#            range, a ';' / ',', a weekday name or the end of text
+#   closed - "geschlossen"
+# Possessive quantifiers (Python 3.11+) keep the description match linear
+# instead of backtracking a lazy [^;,]*? against the lookahead.
+_TOKEN_RE = re.compile(
+    rf'(?P<day>{_DAY_BOUNDARY})'
+    rf'|(?P<range>\d{{1,2}}:\d{{2}} - \d{{1,2}}:\d{{2}})(?:\s*Uhr\b)?\s*+'
+    rf'(?P<time>(?:(?!{_DAY_BOUNDARY})[^;,\d]|\d(?!\d?:\d{{2}}\s*[-–]))*+)'
+    rf'(?=\d{{1,2}}:\d{{2}}\s*[-–]|[;,]|{_DAY_BOUNDARY}|$)'
+    r'|(?P<closed>geschlossen)',
+    re.IGNORECASE
+)
+
+
+def _normalize_match(m: re.Match) -> str:
+    if m.group(1):
+        return m.group(1) + " - "
+    return " "
 
-def extract_clean_times(raw_text: str) -> list:
+
+def normalize(raw_text: str) -> str:
+    """Collapse whitespace and unify time range separators in one pass."""
+    return _NORMALIZE_RE.sub(_normalize_match, raw_text).strip()
+
+
+def extract_times(text: str, day: str = None) -> list:
+    """
+    Extract "HH:MM - HH:MM Uhr DESCRIPTION" entries from normalized text,
+    followed by "Geschlossen" if the text says so. If day is given, only
+    text before the first weekday name and after mentions of day is used.
+    """
+    times = []
+    closed = False
+    current = None
+    for m in _TOKEN_RE.finditer(text):
+        kind = m.lastgroup
+        if kind == 'day':
+            name = m.group('day')
+            current = _DAY_NAMES.get(name) or _DAY_NAMES.get(name.lower()) or name.capitalize()
+            continue
+        if day is not None and current is not None and current != day:
+            continue
+        if kind == 'closed':
+            closed = True
+            continue
+
+        description = m.group('time').strip()
+        closed = closed or 'geschlossen' in description.lower()
+        # Matches start at a clock time, so there is no weekday prefix to strip
+        entry = f"{m.group('range')} Uhr {description}".rstrip()
+        # Limit length (reasonable line length), truncate at word boundary
+        if len(entry) > MAX_ENTRY_LENGTH:
+            cut = entry.rfind(' ', 0, MAX_ENTRY_LENGTH)
+            entry = entry[:cut] if cut >= 0 else entry[:MAX_ENTRY_LENGTH]
+        times.append(entry)
+
+    if closed:
+        times.append('Geschlossen')
+
+    return times
+
+
+def dedup(entries: list) -> list:
+    """Drop case-insensitive duplicates; first occurrence wins, order kept."""
+    unique = {}
+    for entry in entries:
+        unique.setdefault(entry.lower(), entry)
+    return list(unique.values())
+
+
+def extract_clean_times(raw_text: str, day: str = None) -> list:
     """
     Extract ONLY complete time entries from raw text.
     Pattern: "HH:MM - HH:MM Uhr DESCRIPTION" or "HH:MM-HH:MM Uhr DESCRIPTION"
-    
+
     Examples that should match:
     - "06:30 - 08:00 Uhr öffentl. Schwimmen"
-    - "08:00 - 22:00 Uhr nur Schul-, Vereins-, Kursbetrieb"
+    - "08:00 - 22:00 Uhr nur Schul-" (from "... Schul-, Vereins-, Kursbetrieb";
+      the description ends at the first comma)
     - "10:30-17:30 Uhr öffentl. Schwimmen mit eingeschränkter Wasserfläche"
     - "Geschlossen"
+
+    If day is given, text following the name of another weekday is
+    ignored (it belongs to that day, not to this one).
     """
     if not raw_text:
         return []
-    
-    # Clean up: remove excessive whitespace, tabs, newlines
-    cleaned = re.sub(r'[\n\t\r]+', ' ', raw_text)
-    cleaned = re.sub(r'\s+', ' ', cleaned).strip()
-    
-    times = []
-    seen = set()  # Track to avoid duplicates
-    
-    # Pattern 1: "HH:MM - HH:MM Uhr DESCRIPTION" or "HH:MM-HH:MM Uhr DESCRIPTION"
-    time_pattern = re.compile(
-        r'(\d{1,2}:\d{2}\s*-\s*\d{1,2}:\d{2}\s*Uhr\s+[^,]*?)(?=\d{1,2}:\d{2}\s*[-–]|\s*(?:Montag|Dienstag|Mittwoch|Donnerstag|Freitag|Samstag|Sonntag)|$)',
-        re.IGNORECASE
-    )
-    
-    for match in time_pattern.finditer(cleaned):
-        entry = match.group(1).strip()
-        
-        # Remove leading weekday name if present
-        entry = re.sub(r'^(Montag|Dienstag|Mittwoch|Donnerstag|Freitag|Samstag|Sonntag)\s+', '', entry, flags=re.IGNORECASE)
-        entry = entry.strip()
-        
-        # Only keep if it's not too short and contains time pattern
-        if len(entry) > 5 and re.search(r'\d{1,2}:\d{2}', entry):
-            # Limit length to 120 chars (reasonable line length)
-            if len(entry) > 120:
-                entry = entry[:120].rsplit(' ', 1)[0]  # Truncate at word boundary
-            
-            # Deduplicate (case-insensitive)
-            entry_key = entry.lower()
-            if entry_key not in seen:
-                times.append(entry)
-                seen.add(entry_key)
-    
-    # Pattern 2: Check for "Geschlossen"
-    if re.search(r'geschlossen', cleaned, re.IGNORECASE):
-        if 'Geschlossen' not in times:
-            times.append('Geschlossen')
-    
-    return times
 
-# Clean each pool
-for pool in pools:
-    print(f"\n📍 {pool['name']}")
-    
+    return dedup(extract_times(normalize(raw_text), day))
+
+
+def clean_pool(pool: dict) -> dict:
+    """Return a copy of pool with every weekday's hours cleaned."""
+    hours = {}
     for day in WEEKDAYS:
-        entries = pool["hours"].get(day, [])
+        entries = pool.get("hours", {}).get(day, [])
         if not isinstance(entries, list):
             entries = [entries]
-        
+
         # Combine all entries for this day into one text
         combined_text = " ".join(str(e) for e in entries if e)
-        
-        # Extract clean times
-        cleaned = extract_clean_times(combined_text)
-        pool["hours"][day] = cleaned
-        
-        # Debug output
-        if cleaned:
-            print(f"  ✅ {day}: {len(cleaned)} entry(ies)")
-            for entry in cleaned:
-                preview = entry[:90] + "..." if len(entry) > 90 else entry
-                print(f"     → {preview}")
-        else:
-            print(f"  ⚠️  {day}: (no data)")
-
-# Save cleaned data
-with open(data_path, "w", encoding="utf-8") as f:
-    json.dump(pools, f, ensure_ascii=False, indent=2)
-
-print(f"\n✅ Done! Cleaned {len(pools)} pools and saved to {data_path}")
+        hours[day] = extract_clean_times(combined_text, day)
+    return {**pool, "hours": hours}
+
+
+def main(pools: list = None):
+    """Clean pools (read from DATA_PATH if not given) and write them to DATA_PATH."""
+    if pools is None:
+        if not DATA_PATH.exists():
+            print(f"Error: {DATA_PATH} not found")
+            return
+        pools = orjson.loads(DATA_PATH.read_bytes())
+
+    if len(pools) >= PARALLEL_MIN_POOLS:
+        # Pure-Python regex work is GIL-bound, so spread pools over processes
+        with ProcessPoolExecutor() as ex:
+            pools = list(ex.map(clean_pool, pools, chunksize=4))
+    else:
+        pools = [clean_pool(pool) for pool in pools]
+
+    for pool in pools:
+        print(f"\n📍 {pool.get('name', 'Unknown')}")
+        for day in WEEKDAYS:
+            cleaned = pool["hours"][day]
+            if cleaned:
+                print(f"  ✅ {day}: {len(cleaned)} entry(ies)")
+                for entry in cleaned:
+                    preview = entry[:90] + "..." if len(entry) > 90 else entry
+                    print(f"     → {preview}")
+            else:
+                print(f"  ⚠️  {day}: (no data)")
+
+    # Atomic replace: readers see the old or the new file, never a partial one
+    tmp = DATA_PATH.with_suffix(".json.tmp")
+    tmp.write_bytes(orjson.dumps(pools, option=orjson.OPT_INDENT_2))
+    os.replace(tmp, DATA_PATH)
+
+    print(f"\n✅ Done! Cleaned {len(pools)} pools and saved to {DATA_PATH}")
+
 
+if __name__ == "__main__":
+    main()
@@ -4,10 +4,14 @@ Strict cleaner with plausibility checks.
 Ensures data quality and reasonable entry counts per day.
 """
 
-import json
+import os
 import re
+import sys
+from functools import lru_cache
 from pathlib import Path
 
+import orjson
+
 DATA_PATH = Path(__file__).resolve().parent / "data" / "pools.json"
 
 WEEKDAYS = [
@@ -20,6 +24,33 @@ WEEKDAYS = [
     "Sonntag",
 ]
 
+# Compiled once at import instead of rebuilding the pattern string per entry
+_WEEKDAY_ALT = "|".join(WEEKDAYS)
+_WEEKDAY_PREFIX_RE = re.compile(rf'^(?:{_WEEKDAY_ALT})\s*', re.IGNORECASE)
+_DOUBLE_WEEKDAY_RE = re.compile(rf'\b({_WEEKDAY_ALT})\b\s+\1\b', re.IGNORECASE)
+# Single sweep for entry normalization: time separators, "Uhr" spacing,
+# trailing punctuation and whitespace runs. The sep_uhr / lookahead branches
+# reproduce the spacing the former one-rule-per-pass pipeline produced.
+_CLEAN_RE = re.compile(
+    r'(?P<sep>\s*[–—-]\s*)(?P<sep_uhr>[Uu]hr(?=[\s–—-]))?'
+    r'|(?P<uhr>\s+[Uu]hr)(?:(?=\s*[–—-])|(?P<uhr_ws>\s+))'
+    r'|(?<=[0-9])(?P<uhr_join>[Uu]hr)'
+    r'|(?P<trail>[,;\.]+\s*$)'
+    r'|\s+'
+)
+_TIME_RE = re.compile(r'\d{1,2}:\d{2}\s*[-–]\s*\d{1,2}:\d{2}')
+_TIME_HEAD_RE = re.compile(r"^(\d{1,2}:\d{2}\s*[-–]\s*\d{1,2}:\d{2}[^\s]*)(?:\s+(.*))?")
+# Splits parts with several time windows concatenated (e.g. "06:30 - 16:00 ... 16:00 - 22:00 ...")
+_MULTI_RE = re.compile(r'(\d{1,2}:\d{2}\s*[-–]\s*\d{1,2}:\d{2}(?:\s+[Uu]hr)?\s*.*?)(?=\d{1,2}:\d{2}\s*[-–]|$)', re.IGNORECASE)
+# The same split without the lazy .*? / lookahead: a window starts at a time
+# range and runs up to the next window anchor (or the end of the part)
+_WINDOW_RE = re.compile(r'\d{1,2}:\d{2}\s*[-–]\s*\d{1,2}:\d{2}(?:\s+[Uu]hr)?\s*', re.IGNORECASE)
+_WINDOW_ANCHOR_RE = re.compile(r'\d{1,2}:\d{2}\s*[-–]')
+_START_RE = re.compile(r"(\d{1,2}):(\d{2})")
+# Description keywords, one scan each instead of a substring test per spelling
+_SCHUL_RE = re.compile(r'schul|verein|kurs')
+_OEFFENT_RE = re.compile(r'[öo]ffent')
+
 # Plausibility rules
 MIN_ENTRIES_PER_DAY = 1
 MAX_ENTRIES_PER_DAY = 4
@@ -27,16 +58,29 @@ MAX_ENTRIES_PER_DAY = 4
 
 def is_valid_entry(entry: str) -> bool:
     """Validate a single entry."""
-    if not entry or len(entry) < 8:
+    # A time range holds two colons; count() rejects the rest without the regex
+    if not entry or len(entry) < 8 or entry.count(':') < 2:
         return False
     
     # Must have time pattern
-    if not re.search(r'\d{1,2}:\d{2}\s*[-–]\s*\d{1,2}:\d{2}', entry):
-        return False
-    
-    return True
+    return _TIME_RE.search(entry) is not None
+
+
+def _clean_match(m: re.Match) -> str:
+    if m.group("sep"):
+        return " - Uhr" if m.group("sep_uhr") else " - "
+    if m.group("uhr"):
+        return " Uhr " if m.group("uhr_ws") else " Uhr"
+    if m.group("uhr_join"):
+        return " " + m.group("uhr_join")
+    if m.group("trail"):
+        return ""
+    return " "
 
 
+# Cached like normalize_description: both are pure, and the same phrases
+# recur across pools and days
+@lru_cache(maxsize=4096)
 def clean_entry(entry: str) -> str:
     """Normalize entry."""
     if not isinstance(entry, str):
@@ -44,31 +88,24 @@ def clean_entry(entry: str) -> str:
     
     entry = entry.strip()
     
-    # Remove leading weekday names and duplicated weekday tokens like "Sonntag Sonntag"
-    entry = re.sub(rf'^({"|".join(WEEKDAYS)})\s*', '', entry, flags=re.IGNORECASE).strip()
-    entry = re.sub(rf'\b({'|'.join(WEEKDAYS)})\b\s+\1\b', r'\1', entry, flags=re.IGNORECASE)
+    # Remove leading weekday names and duplicated weekday tokens like "Sonntag Sonntag".
+    # Windows split off at a clock time start with a digit and skip the prefix regex.
+    if entry[:1].isalpha():
+        entry = _WEEKDAY_PREFIX_RE.sub('', entry).strip()
+    entry = _DOUBLE_WEEKDAY_RE.sub(r'\1', entry)
     
-    # Normalize whitespace
-    entry = re.sub(r'[\n\t\r]+', ' ', entry)
-    entry = re.sub(r'\s+', ' ', entry).strip()
-    
-    # Normalize time separator
-    entry = re.sub(r'\s*[–—-]\s*', ' - ', entry)
-    
-    # Ensure "Uhr" spacing
-    entry = re.sub(r'\s+[Uu]hr\s+', ' Uhr ', entry)
-    entry = re.sub(r'([0-9])([Uu]hr)', r'\1 \2', entry)
-    
-    # Remove trailing junk
-    entry = re.sub(r'[,;\.]+\s*$', '', entry)
+    # Normalize whitespace, time separator, "Uhr" spacing and trailing junk
+    entry = _CLEAN_RE.sub(_clean_match, entry)
     
     # Truncate at word boundary if too long
     if len(entry) > 120:
-        entry = entry[:120].rsplit(' ', 1)[0]
+        cut = entry.rfind(' ', 0, 120)
+        entry = entry[:cut] if cut >= 0 else entry[:120]
     
     return entry.strip()
 
 
+@lru_cache(maxsize=4096)
 def normalize_description(entry: str) -> str:
     """Normalize common description variants to a short canonical form.
 
@@ -77,31 +114,28 @@ def normalize_description(entry: str) -> str:
       - "nur Schul-, Vereins-, Kursbetrieb" variants -> "nur Schul-/Vereins-/Kursbetrieb"
     """
     # Split time part and description
-    m = re.match(r"^(\d{1,2}:\d{2}\s*[-–]\s*\d{1,2}:\d{2}[^\s]*)(?:\s+(.*))?", entry)
+    m = _TIME_HEAD_RE.match(entry)
     if not m:
         return entry
 
     time_part = m.group(1).strip()
     desc = (m.group(2) or "").strip()
+    if not desc:
+        return time_part
 
     desc_l = desc.lower()
 
     # Normalize common phrases
-    if not desc_l:
-        normalized_desc = ""
-    elif 'eingeschränk' in desc_l or 'eingeschraenk' in desc_l or 'eingeschr' in desc_l:
+    if 'eingeschr' in desc_l:
         # public swimming with restricted water surface
-        if 'öffent' in desc_l or 'offent' in desc_l:
-            normalized_desc = 'öffentl. Schwimmen (eingeschr. WF)'
-        else:
-            normalized_desc = 'öffentl. Schwimmen (eingeschr. WF)'
-    elif any(k in desc_l for k in ['schul', 'verein', 'kurs']):
+        normalized_desc = 'öffentl. Schwimmen (eingeschr. WF)'
+    elif _SCHUL_RE.search(desc_l):
         normalized_desc = 'nur Schul-/Vereins-/Kursbetrieb'
     elif 'gemischt' in desc_l:
         normalized_desc = 'gemischt'
-    elif 'menschen mit behinderung' in desc_l or 'behinderung' in desc_l:
+    elif 'behinderung' in desc_l:
         normalized_desc = 'Menschen mit Behinderung'
-    elif 'öffent' in desc_l or 'offent' in desc_l:
+    elif _OEFFENT_RE.search(desc_l):
         normalized_desc = 'öffentl. Schwimmen'
     else:
         # Fallback: shorten long descriptions
@@ -113,68 +147,103 @@ def normalize_description(entry: str) -> str:
     return time_part
 
 
+def start_minutes(e: str) -> int:
+    """Sort key: minutes since midnight of the first clock time, entries without one last."""
+    # Cleaned entries start with "HH:MM" / "H:MM"; read those by slicing
+    if len(e) >= 5 and e[2] == ':' and e[:2].isdecimal() and e[3:5].isdecimal():
+        return int(e[:2]) * 60 + int(e[3:5])
+    if len(e) >= 4 and e[1] == ':' and e[0].isdecimal() and e[2:4].isdecimal():
+        return int(e[:1]) * 60 + int(e[2:4])
+    m = _START_RE.search(e)
+    if not m:
+        return 24 * 60
+    return int(m.group(1)) * 60 + int(m.group(2))
+
+
+def split_windows(part: str) -> list:
+    """Split a part into its time windows, stripped; [] if it holds no time range."""
+    if '\n' in part:
+        # '.' stops at newlines, which the anchor split does not model
+        return [m.group(1).strip() for m in _MULTI_RE.finditer(part)]
+    windows = []
+    pos = 0
+    while True:
+        m = _WINDOW_RE.search(part, pos)
+        if m is None:
+            return windows
+        anchor = _WINDOW_ANCHOR_RE.search(part, m.end())
+        pos = anchor.start() if anchor else len(part)
+        windows.append(part[m.start():pos].strip())
+
+
+def iter_cleaned_entries(raw_entries):
+    """Yield the valid, normalized entries of one day in order ("Geschlossen" as-is)."""
+    for raw_entry in raw_entries:
+        if not isinstance(raw_entry, str):
+            continue
+        
+        # Check for "Geschlossen" first - preserve it as-is
+        if 'geschlossen' in raw_entry.lower():
+            yield "Geschlossen"
+            continue
+        
+        # Split by semicolon first
+        for part in raw_entry.split(';'):
+            part = part.strip()
+            # No clock time, nothing the pipeline below could accept
+            if ':' not in part:
+                continue
+            # If a part contains multiple time windows concatenated,
+            # split them at the time range anchors.
+            candidates = split_windows(part) or (part,)
+
+            for cand in candidates:
+                if not cand:
+                    continue
+                cleaned_entry = clean_entry(cand)
+                # Normalize description variants
+                normalized_entry = normalize_description(cleaned_entry)
+                # Validate
+                if is_valid_entry(normalized_entry):
+                    yield normalized_entry
+
+
 def main():
     if not DATA_PATH.exists():
         print(f"❌ {DATA_PATH} not found")
         return
     
-    with DATA_PATH.open("r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = orjson.loads(DATA_PATH.read_bytes())
     
     print(f"Cleaning {len(data)} pools with plausibility checks...\n")
     
+    # (pool name, Montag entry count), recorded while cleaning for the summary
+    summary = []
     for pool in data:
         pool_name = pool.get("name", "Unknown")
-        print(f"📍 {pool_name}")
+        # One stdout write per pool instead of one per message
+        buf = [f"📍 {pool_name}\n"]
         
         # Clean each day
+        hours = pool["hours"]
         for weekday in WEEKDAYS:
-            raw_entries = pool["hours"].get(weekday, [])
+            raw_entries = hours.get(weekday, [])
             raw_count = len(raw_entries) if isinstance(raw_entries, list) else 0
             
-            # Clean and validate
-            cleaned = []
-            seen = set()
-            
-            for raw_entry in raw_entries:
-                if not isinstance(raw_entry, str):
-                    continue
-                
-                # Check for "Geschlossen" first - preserve it as-is
-                if 'geschlossen' in raw_entry.lower():
-                    cleaned.append("Geschlossen")
-                    continue
-                
-                # Split by semicolon first
-                semiparts = [p.strip() for p in raw_entry.split(';') if p.strip()]
-                for part in semiparts:
-                    # If a part contains multiple time windows concatenated (e.g. "06:30 - 16:00 ... 16:00 - 22:00 ..."),
-                    # split them using a time-based regex with lookahead.
-                    multi_pattern = re.compile(r'(\d{1,2}:\d{2}\s*[-–]\s*\d{1,2}:\d{2}(?:\s+[Uu]hr)?\s*.*?)(?=\d{1,2}:\d{2}\s*[-–]|$)', re.IGNORECASE)
-                    submatches = multi_pattern.findall(part)
-                    if submatches:
-                        candidates = [s.strip() for s in submatches if s.strip()]
-                    else:
-                        candidates = [part]
-
-                    for cand in candidates:
-                        cleaned_entry = clean_entry(cand)
-                        # Normalize description variants
-                        normalized_entry = normalize_description(cleaned_entry)
-
-                        # Validate
-                        if not is_valid_entry(normalized_entry):
-                            continue
-
-                        # Deduplicate
-                        key = normalized_entry.lower()
-                        if key not in seen:
-                            seen.add(key)
-                            cleaned.append(normalized_entry)
+            # Clean and validate; keyed by lowercase entry, first spelling wins.
+            # Entries are produced lazily, so stop one past the cap: whatever
+            # follows would be truncated anyway.
+            unique = {}
+            for entry in iter_cleaned_entries(raw_entries):
+                unique.setdefault(entry.lower(), entry)
+                if len(unique) > MAX_ENTRIES_PER_DAY:
+                    break
+
+            cleaned = list(unique.values())
             
             # Apply plausibility check
             if len(cleaned) > MAX_ENTRIES_PER_DAY:
-                print(f"  ⚠️  {weekday}: {len(cleaned)} entries (max={MAX_ENTRIES_PER_DAY}) - truncating")
+                buf.append(f"  ⚠️  {weekday}: more than {MAX_ENTRIES_PER_DAY} entries - truncating\n")
                 cleaned = cleaned[:MAX_ENTRIES_PER_DAY]
             
             # If completely empty and not "Geschlossen", add "?" to indicate missing data
@@ -182,39 +251,36 @@ def main():
                 cleaned = ["?"]
             
             if len(cleaned) > 0:
-                print(f"  ✅ {weekday}: {len(cleaned)} entry/entries")
+                buf.append(f"  ✅ {weekday}: {len(cleaned)} entry/entries\n")
             else:
-                print(f"  ⚠️  {weekday}: [empty]")
+                buf.append(f"  ⚠️  {weekday}: [empty]\n")
 
             # Debug: if raw had more entries than cleaned, show what was removed
             if raw_count != len(cleaned):
-                print(f"    (raw: {raw_count} -> cleaned: {len(cleaned)})")
+                buf.append(f"    (raw: {raw_count} -> cleaned: {len(cleaned)})\n")
                 if raw_count > 0:
                     # print raw sample
                     sample = raw_entries if raw_count <= 5 else raw_entries[:5]
-                    print(f"    raw sample: {sample}")
+                    buf.append(f"    raw sample: {sample}\n")
             
             # Post-process: sort by start time and apply weekend preference rules
-            def start_minutes(e: str) -> int:
-                m = re.search(r"(\d{1,2}):(\d{2})", e)
-                if not m:
-                    return 24 * 60
-                return int(m.group(1)) * 60 + int(m.group(2))
-
             # If weekend and public-swimming exists, prefer public entries and drop 'nur Schul' entries
             if weekday in ("Samstag", "Sonntag"):
                 lowers = [e.lower() for e in cleaned]
-                if any('öffent' in s or 'öffentl' in s for s in lowers):
-                    cleaned = [e for e in cleaned if 'nur schul' not in e.lower()]
+                if any('öffent' in s for s in lowers):
+                    cleaned = [e for e, s in zip(cleaned, lowers) if 'nur schul' not in s]
 
             # Sort by start time
             cleaned.sort(key=start_minutes)
 
-            pool["hours"][weekday] = cleaned
+            hours[weekday] = cleaned
+        summary.append((pool.get("name", ""), len(hours["Montag"])))
+        sys.stdout.write("".join(buf))
     
     # Write back
-    with DATA_PATH.open("w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    tmp = DATA_PATH.with_suffix(".json.tmp")
+    tmp.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    os.replace(tmp, DATA_PATH)
     
     print(f"\n✅ Cleaned and saved to {DATA_PATH}")
     
@@ -223,15 +289,15 @@ def main():
     print("VALIDATION SUMMARY")
     print("=" * 70)
     
-    for pool in data:
-        pool_name = pool.get("name", "")
-        montag_count = len(pool["hours"].get("Montag", []))
-        print(f"\n{pool_name}")
-        print(f"  Montag: {montag_count} entries")
+    buf = []
+    for pool_name, montag_count in summary:
+        buf.append(f"\n{pool_name}\n")
+        buf.append(f"  Montag: {montag_count} entries\n")
         if montag_count < MIN_ENTRIES_PER_DAY or montag_count > MAX_ENTRIES_PER_DAY:
-            print(f"    ⚠️  WARNING: Outside plausible range [{MIN_ENTRIES_PER_DAY}, {MAX_ENTRIES_PER_DAY}]")
+            buf.append(f"    ⚠️  WARNING: Outside plausible range [{MIN_ENTRIES_PER_DAY}, {MAX_ENTRIES_PER_DAY}]\n")
         else:
-            print(f"    ✅ OK")
+            buf.append("    ✅ OK\n")
+    sys.stdout.write("".join(buf))
 
 
 if __name__ == "__main__":
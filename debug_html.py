@@ -8,8 +8,8 @@ import json
 url = 'https://www.berlinerbaeder.de/baeder/detail/schwimmhalle-fischerinsel/'
 print(f"Fetching {url}...")
 resp = requests.get(url, timeout=10)
-resp.encoding = resp.apparent_encoding
-soup = BeautifulSoup(resp.text, 'html.parser')
+# Bytes direkt an BeautifulSoup: Encoding kommt aus <meta charset>, kein chardet über den ganzen Body
+soup = BeautifulSoup(resp.content, 'lxml')
 
 print("\n=== Looking for opening hours structure ===\n")
 
@@ -7,14 +7,22 @@ import re
 
 url = 'https://www.berlinerbaeder.de/baeder/detail/schwimmhalle-fischerinsel/'
 resp = requests.get(url, timeout=10)
-resp.encoding = resp.apparent_encoding
-soup = BeautifulSoup(resp.text, 'html.parser')
+# Bytes direkt an BeautifulSoup: Encoding kommt aus <meta charset>, kein chardet über den ganzen Body
+soup = BeautifulSoup(resp.content, 'lxml')
+
+WEEKDAYS = ["Montag", "Dienstag", "Mittwoch", "Donnerstag", "Freitag", "Samstag", "Sonntag"]
+
+# Einmal kompiliert, ein Durchlauf: Leerzeilen zusammenfassen (-> '\n'),
+# Tabs/Spaces vereinheitlichen (-> ' ')
+NORMALIZE_RE = re.compile(r'\n\s*\n+|[ \t]+')
+# Ein Suchlauf pro Zeile statt sieben lower()-Vergleiche; eine Gruppe je Wochentag
+WEEKDAY_SCAN_RE = re.compile('|'.join(f'({wd})' for wd in WEEKDAYS), re.IGNORECASE)
+TIME_RANGE_RE = re.compile(r'\d{1,2}:\d{2}\s*-\s*\d{1,2}:\d{2}')
 
 full_text = soup.get_text(separator="\n", strip=True)
 
 # Normalize
-full_text = re.sub(r'\n\s*\n+', '\n', full_text)
-full_text = re.sub(r'[ \t]+', ' ', full_text)
+full_text = NORMALIZE_RE.sub(lambda m: '\n' if m.group()[0] == '\n' else ' ', full_text)
 
 lines = full_text.split('\n')
 
@@ -22,30 +30,26 @@ print("=" * 80)
 print("SEARCHING FOR WEEKDAY NAMES IN TEXT")
 print("=" * 80)
 
-WEEKDAYS = ["Montag", "Dienstag", "Mittwoch", "Donnerstag", "Freitag", "Samstag", "Sonntag"]
-
 for i, line in enumerate(lines):
     line_stripped = line.strip()
-    for wd in WEEKDAYS:
-        if wd.lower() in line_stripped.lower():
-            print(f"\nLine {i}: Found '{wd}'")
-            print(f"  Content: {line_stripped[:100]}")
-            # Show next 5 lines
-            for j in range(1, 6):
-                if i + j < len(lines):
-                    next_line = lines[i + j].strip()
-                    print(f"  Line {i+j}: {next_line[:100]}")
-            break
+    m = WEEKDAY_SCAN_RE.search(line_stripped)
+    if m:
+        wd = WEEKDAYS[m.lastindex - 1]
+        print(f"\nLine {i}: Found '{wd}'")
+        print(f"  Content: {line_stripped[:100]}")
+        # Show next 5 lines
+        for j in range(1, 6):
+            if i + j < len(lines):
+                next_line = lines[i + j].strip()
+                print(f"  Line {i+j}: {next_line[:100]}")
 
 print("\n" + "=" * 80)
 print("SEARCHING FOR TIME PATTERNS")
 print("=" * 80)
 
-time_pattern = re.compile(r'\d{1,2}:\d{2}\s*-\s*\d{1,2}:\d{2}')
-
 time_matches = 0
 for i, line in enumerate(lines):
-    if time_pattern.search(line):
+    if TIME_RANGE_RE.search(line):
         time_matches += 1
         print(f"Line {i}: {line[:100]}")
 
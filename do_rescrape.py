@@ -1,48 +1,58 @@
 #!/usr/bin/env python3
 """
 Rescrape with improved structural parser and strict cleaner.
+
+Scraper and cleaner run in this process; the scraped pools are handed to
+the cleaner directly instead of being re-read from data/pools.json.
 """
 
-import subprocess
 from pathlib import Path
 
+import clean_data
+from scraper import scrape_pools
+
 base_path = Path(__file__).resolve().parent
 urls_file = base_path / "urls.txt"
 
-if not urls_file.exists():
-    print(f"Error: {urls_file} not found")
-    exit(1)
 
-urls = [line.strip() for line in urls_file.read_text(encoding="utf-8").splitlines() if line.strip()]
+def main():
+    if not urls_file.exists():
+        print(f"Error: {urls_file} not found")
+        exit(1)
+
+    urls = [line.strip() for line in urls_file.read_text(encoding="utf-8").splitlines() if line.strip()]
 
-if not urls:
-    print("No URLs found")
-    exit(1)
+    if not urls:
+        print("No URLs found")
+        exit(1)
 
-print(f"Rescraping {len(urls)} pools with structural parser...\n")
+    print(f"Rescraping {len(urls)} pools with structural parser...\n")
 
-# Run scraper
-result = subprocess.run(
-    ["python3", "scraper/scrape_pools.py"] + urls,
-    cwd=base_path
-)
+    # Run scraper
+    try:
+        pools = scrape_pools.scrape(urls)
+        scrape_pools.write_json(pools)
+    except Exception as e:
+        print(f"Scraper failed: {e}")
+        exit(1)
 
-if result.returncode != 0:
-    print("Scraper failed")
-    exit(1)
+    print("\n" + "="*70)
+    print("Scraping complete. Running strict cleaner...")
+    print("="*70 + "\n")
 
-print("\n" + "="*70)
-print("Scraping complete. Running strict cleaner...")
-print("="*70 + "\n")
+    # Run cleaner
+    try:
+        clean_data.main(pools)
+    except Exception as e:
+        print(f"Cleaner failed: {e}")
+        exit(1)
 
-# Run cleaner
-result = subprocess.run(["python3", "clean_strict.py"], cwd=base_path)
+    print("\n" + "="*70)
+    print("✅ All done! Data is clean and ready to deploy.")
+    print("="*70)
+    print("\nNext step: git add -A && git commit -m \"fix: structural table parser\" && git push")
 
-if result.returncode != 0:
-    print("Cleaner failed")
-    exit(1)
 
-print("\n" + "="*70)
-print("✅ All done! Data is clean and ready to deploy.")
-print("="*70)
-print("\nNext step: git add -A && git commit -m \"fix: structural table parser\" && git push")
+# Guarded: clean_data's worker processes may re-import this module
+if __name__ == "__main__":
+    main()
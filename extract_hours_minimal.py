@@ -3,9 +3,56 @@ MINIMALBEISPIEL: Strukturelle Extraktion der Öffnungszeiten ohne Regex-Fallstri
 Garantiert keine Zeitmischung zwischen Tagen - rein tabellenbasiert.
 """
 
-from bs4 import BeautifulSoup
+import re
 from typing import Dict, List
 
+from lxml import etree
+from lxml import html as lxml_html
+
+WEEKDAYS = ['Montag', 'Dienstag', 'Mittwoch', 'Donnerstag', 'Freitag', 'Samstag', 'Sonntag']
+# (Wochentag, Abkürzung): "mo", "di", "mi", "do", "fr", "sa", "so" - einmal statt pro Zelle und Tag.
+# Der volle Name enthält die Abkürzung, ein Test auf die Abkürzung genügt also.
+_WEEKDAY_ABBRS = tuple((day, day[:2].lower()) for day in WEEKDAYS)
+# Zellen bzw. Einzeleinträge ohne Öffnungszeit (verglichen mit dem kleingeschriebenen Text)
+NO_HOURS_CELLS = frozenset({'geschlossen', '-', 'ruhetag'})
+NO_HOURS_ENTRIES = frozenset({'geschlossen', '-'})
+
+# XPath-Ausdrücke einmal kompiliert (libxml2 statt Python-Baumwanderung)
+_UPPER = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+_LOWER = 'abcdefghijklmnopqrstuvwxyz'
+# Erste Tabelle, deren Text (kleingeschrieben) einen Wochentag enthält
+FIRST_WEEKDAY_TABLE = etree.XPath(
+    '(//table[' + ' or '.join(
+        f"contains(translate(string(.), '{_UPPER}', '{_LOWER}'), '{day.lower()}')" for day in WEEKDAYS
+    ) + '])[1]'
+)
+# Nur der Bereich vom ersten <table> bis zum letzten </table> wird geparst;
+# Kopf, Navigation und Footer davor/danach braucht die Tabellensuche nicht
+TABLE_OPEN_RE = re.compile(r'<table\b', re.IGNORECASE)
+TABLE_CLOSE_RE = re.compile(r'</table\s*>', re.IGNORECASE)
+ROWS = etree.XPath('.//tr')
+CELLS = etree.XPath('.//th|.//td')
+# Textknoten wie bei BeautifulSoup.get_text(): ohne <script>/<style>-Inhalt
+CELL_TEXTS = etree.XPath('.//text()[not(parent::script or parent::style)]')
+
+
+def _cell_text(cell, separator: str = '') -> str:
+    """Entspricht BeautifulSoup get_text(separator, strip=True)."""
+    return separator.join(t for t in (t.strip() for t in CELL_TEXTS(cell)) if t)
+
+
+def _find_weekday_table(html: str):
+    """Erste Tabelle mit Wochentag-Referenzen oder None."""
+    start = TABLE_OPEN_RE.search(html) if html else None
+    if start is None:
+        return None
+    end = None
+    for end in TABLE_CLOSE_RE.finditer(html, start.start()):
+        pass
+    region = html[start.start():end.end() if end else len(html)]
+    tables = FIRST_WEEKDAY_TABLE(lxml_html.fromstring(region))
+    return tables[0] if tables else None
+
 
 def parse_opening_hours_table(html: str) -> Dict[str, List[str]]:
     """
@@ -19,44 +66,34 @@ def parse_opening_hours_table(html: str) -> Dict[str, List[str]]:
     4. Trenne mehrere Einträge pro Tag durch \n-Split in Zelltext
     """
     
-    soup = BeautifulSoup(html, 'html.parser')
-    
     # Wochentage in erwarteter Reihenfolge
-    weekday_names = ['Montag', 'Dienstag', 'Mittwoch', 'Donnerstag', 'Freitag', 'Samstag', 'Sonntag']
+    weekday_names = WEEKDAYS
     result = {day: [] for day in weekday_names}
     
     # === SCHRITT 1: Finde die Öffnungszeiten-Tabelle ===
-    tables = soup.find_all('table')
+    # Suche nach Tabelle mit Wochentag-Referenzen (ein XPath-Aufruf)
+    opening_table = _find_weekday_table(html)
     
-    opening_table = None
-    for table in tables:
-        # Suche nach Tabelle mit Wochentag-Referenzen
-        if any(day.lower() in table.get_text().lower() for day in weekday_names):
-            opening_table = table
-            break
-    
-    if not opening_table:
+    if opening_table is None:
         return result  # Keine Tabelle gefunden
     
     # === SCHRITT 2: Header-Zeile analysieren ===
-    rows = opening_table.find_all('tr')
+    rows = ROWS(opening_table)
     if not rows:
         return result
     
     header_row = rows[0]
-    header_cells = header_row.find_all(['th', 'td'])
+    header_cells = CELLS(header_row)
     
     # Bestimme Spalten-Zuordnung
     column_to_weekday = {}  # {column_index: 'Montag'}
     
     for col_idx, header_cell in enumerate(header_cells):
-        header_text = header_cell.get_text(strip=True).lower()
+        header_text = _cell_text(header_cell).lower()
         
         # Suche nach Wochentag-Abkürzung oder Name
-        for weekday in weekday_names:
-            abbr = weekday.lower()[:2]  # "mo", "di", "mi", "do", "fr", "sa", "so"
-            
-            if abbr in header_text or weekday.lower() in header_text:
+        for weekday, abbr in _WEEKDAY_ABBRS:
+            if abbr in header_text:
                 column_to_weekday[col_idx] = weekday
                 break
     
@@ -67,7 +104,7 @@ def parse_opening_hours_table(html: str) -> Dict[str, List[str]]:
     
     # === SCHRITT 3: Datensätze extrahieren ===
     for data_row in rows[1:]:
-        cells = data_row.find_all(['th', 'td'])
+        cells = CELLS(data_row)
         
         for col_idx, weekday in column_to_weekday.items():
             if col_idx >= len(cells):
@@ -76,12 +113,13 @@ def parse_opening_hours_table(html: str) -> Dict[str, List[str]]:
             cell = cells[col_idx]
             
             # Hole gesamten Text aus Zelle, mit \n für Zeilenumbrüche
-            cell_text = cell.get_text(separator='\n', strip=True)
+            cell_text = _cell_text(cell, '\n')
             
             # Teile mehrere Einträge durch Newlines
-            if cell_text and cell_text.lower() not in ['geschlossen', '-', 'ruhetag']:
-                entries = [entry.strip() for entry in cell_text.split('\n') 
-                          if entry.strip() and entry.strip().lower() not in ['geschlossen', '-']]
+            if cell_text and cell_text.lower() not in NO_HOURS_CELLS:
+                # Jede Zeile nur einmal strippen und kleinschreiben
+                entries = [entry for entry in (line.strip() for line in cell_text.split('\n'))
+                           if entry and entry.lower() not in NO_HOURS_ENTRIES]
                 
                 result[weekday].extend(entries)
     
@@ -96,28 +134,24 @@ def get_pool_hours_clean(html: str) -> Dict[str, List[str]]:
     Eingabe: HTML-String
     Ausgabe: {Wochentag: [Zeit1, Zeit2, ...]}
     """
-    soup = BeautifulSoup(html, 'html.parser')
-    days = ['Montag', 'Dienstag', 'Mittwoch', 'Donnerstag', 'Freitag', 'Samstag', 'Sonntag']
+    days = WEEKDAYS
     hours = {day: [] for day in days}
     
     # Finde Tabelle mit Wochentagen
-    table = next(
-        (t for t in soup.find_all('table') 
-         if any(d.lower() in t.get_text().lower() for d in days)),
-        None
-    )
+    table = _find_weekday_table(html)
     
-    if not table:
+    if table is None:
         return hours
     
-    rows = table.find_all('tr')
-    headers = rows[0].find_all(['th', 'td']) if rows else []
+    rows = ROWS(table)
+    headers = CELLS(rows[0]) if rows else []
     
     # Map: column_index -> Wochentag
+    # Zelltext einmal pro Kopfzelle statt einmal pro Kopfzelle und Tag
     col_map = {
-        i: day for i, header in enumerate(headers)
-        for day in days
-        if day.lower()[:2] in header.get_text().lower()
+        i: day for i, header_text in enumerate(''.join(CELL_TEXTS(h)).lower() for h in headers)
+        for day, abbr in _WEEKDAY_ABBRS
+        if abbr in header_text
     }
     
     # Fallback
@@ -126,12 +160,12 @@ def get_pool_hours_clean(html: str) -> Dict[str, List[str]]:
     
     # Daten auslesen
     for row in rows[1:]:
-        cells = row.find_all(['th', 'td'])
+        cells = CELLS(row)
         for col_idx, day in col_map.items():
             if col_idx < len(cells):
-                text = cells[col_idx].get_text(separator='\n', strip=True)
-                if text and text.lower() not in ['geschlossen', '-', 'ruhetag']:
-                    hours[day].extend(line.strip() for line in text.split('\n') if line.strip())
+                text = _cell_text(cells[col_idx], '\n')
+                if text and text.lower() not in NO_HOURS_CELLS:
+                    hours[day].extend(line for line in (l.strip() for l in text.split('\n')) if line)
     
     return hours
 
@@ -144,7 +178,12 @@ if __name__ == '__main__':
     url = "https://www.berlinerbaeder.de/baeder/detail/schwimmhalle-fischerinsel/"
     
     try:
-        html = requests.get(url, timeout=10).text
+        resp = requests.get(url, timeout=10)
+        # Charset aus dem Content-Type; ohne Angabe nimmt requests ISO-8859-1 an
+        # (Umlaute kaputt), daher dann UTF-8 statt chardet über den ganzen Body
+        if 'charset' not in resp.headers.get('Content-Type', '').lower():
+            resp.encoding = 'utf-8'
+        html = resp.text
         
         # Hauptfunktion nutzen
         opening_hours = parse_opening_hours_table(html)
@@ -3,15 +3,72 @@ Extraktion von Öffnungszeiten aus der Schwimmhalle Fischerinsel Tabelle.
 Strukturelle Analyse ohne Regex - garantiert keine Zeitmischung zwischen Tagen.
 """
 
-from bs4 import BeautifulSoup
+import re
 from typing import Dict, List
 import requests
+from lxml import etree
+from lxml import html as lxml_html
 
+# XPath-Ausdrücke einmal kompiliert: libxml2 läuft den Baum ab, ohne pro Knoten
+# ein BeautifulSoup-Objekt aufzubauen
+TABLES = etree.XPath('//table')
+ROWS = etree.XPath('.//tr')
+CELLS = etree.XPath('.//th|.//td')
+# Textknoten wie bei BeautifulSoup.get_text(): ohne <script>/<style>-Inhalt und Kommentare
+TEXTS = etree.XPath('.//text()[not(parent::script or parent::style)]')
 
-def extract_opening_hours(html: str) -> Dict[str, List[str]]:
+WEEKDAYS = ['Montag', 'Dienstag', 'Mittwoch', 'Donnerstag', 'Freitag', 'Samstag', 'Sonntag']
+# Kleinschreibung und Kürzel ("mon", "mo") einmal vorberechnet statt pro Zelle und Tag
+WEEKDAYS_LOWER = [day.lower() for day in WEEKDAYS]
+WEEKDAY_ABBR3 = [day[:3] for day in WEEKDAYS_LOWER]
+WEEKDAY_ABBR2 = [day[:2] for day in WEEKDAYS_LOWER]
+# Irgendein Wochentag im Text: ein Suchlauf statt sieben, ohne kleingeschriebene Kopie.
+# ASCII-Faltung entspricht hier genau str.lower() (kein Name enthält ein 'k' oder endet auf 'i')
+WEEKDAY_ANY_RE = re.compile('|'.join(WEEKDAYS), re.ASCII | re.IGNORECASE)
+# Zellinhalte ohne eigene Zeit (Methode 1: Beschreibungen, Methode 2: Ruhetage)
+DESCRIPTION_PREFIXES = ('nur', 'inklusive')
+NO_HOURS_TEXTS = frozenset({'geschlossen', '-', 'ruhetag'})
+
+
+def parse_tables(html: str):
+    """Parst html mit lxml; für beide Extraktionsverfahren wiederverwendbar (None bei leerem Dokument)."""
+    try:
+        return lxml_html.fromstring(html)
+    except etree.ParserError:
+        return None
+
+
+def _text(element, separator: str = '', strip: bool = True) -> str:
+    """Entspricht BeautifulSoup get_text(separator, strip)."""
+    texts = TEXTS(element)
+    if not strip:
+        return separator.join(texts)
+    return separator.join(t for t in (t.strip() for t in texts) if t)
+
+
+def _children_texts(cell) -> List[str]:
+    """Texte der direkten Kinder wie bei BeautifulSoup cell.children (Strings roh, Tags get_text(strip=True))."""
+    texts = [cell.text]
+    for child in cell:
+        if child.tag is etree.Comment:
+            # bs4 liefert Kommentare als Strings unter den Kindern
+            texts.append(child.text)
+        elif child.tag in ('script', 'style'):
+            # get_text() direkt auf <script>/<style> liefert deren Inhalt
+            texts.append(child.text)
+        elif isinstance(child.tag, str):
+            texts.append(_text(child))
+        texts.append(child.tail)
+    return [t for t in (t.strip() for t in texts if t) if t]
+
+
+def extract_opening_hours(html: str, tree=None) -> Dict[str, List[str]]:
     """
     Extrahiert Öffnungszeiten aus HTML-Tabelle.
     
+    Ein bereits mit parse_tables() erzeugter Baum kann übergeben werden,
+    dann wird html nicht erneut geparst.
+    
     Rückgabe:
     {
         'Montag': ['06:30 - 08:00 Uhr öffentl. Schwimmen', '08:00 - 22:00 Uhr nur Schul-', ...],
@@ -20,45 +77,47 @@ def extract_opening_hours(html: str) -> Dict[str, List[str]]:
     }
     """
     
-    soup = BeautifulSoup(html, 'html.parser')
-    weekdays = ['Montag', 'Dienstag', 'Mittwoch', 'Donnerstag', 'Freitag', 'Samstag', 'Sonntag']
+    if tree is None:
+        tree = parse_tables(html)
+    weekdays = WEEKDAYS
     opening_hours = {day: [] for day in weekdays}
     
     # Finde die Öffnungszeiten-Tabelle
     # Strategie: Suche nach table mit Kontext "Öffnungszeiten" oder "Öffnungszeit"
-    tables = soup.find_all('table')
+    tables = TABLES(tree) if tree is not None else []
     
     opening_hours_table = None
     
     # Suche die richtige Tabelle (mit Wochentagen als Header oder Inhalt)
     for table in tables:
-        table_text = table.get_text()
+        table_text = _text(table, strip=False)
         
         # Prüfe, ob Tabelle Wochentag-Namen enthält
-        if any(day.lower() in table_text.lower() for day in weekdays):
+        if WEEKDAY_ANY_RE.search(table_text):
             opening_hours_table = table
             break
     
-    if not opening_hours_table:
+    if opening_hours_table is None:
         return opening_hours
     
     # Analysiere Tabellenstruktur
-    rows = opening_hours_table.find_all('tr')
+    rows = ROWS(opening_hours_table)
     
     # Methode 1: Header-Row mit Wochentagen in <th> oder <td>
     header_row = rows[0] if rows else None
     
-    if header_row:
-        header_cells = header_row.find_all(['th', 'td'])
+    if header_row is not None:
+        header_cells = CELLS(header_row)
         
         # Bestimme Spalten-Zuordnung (welche Spalte = welcher Tag)
         column_to_day = {}
         
         for col_idx, cell in enumerate(header_cells):
-            cell_text = cell.get_text(strip=True).lower()
+            cell_text = _text(cell).lower()
             
-            for day_idx, day in enumerate(weekdays):
-                if day.lower()[:3] in cell_text or day.lower() in cell_text:
+            # Das Kürzel deckt auch den ausgeschriebenen Namen ab
+            for day, abbr in zip(weekdays, WEEKDAY_ABBR3):
+                if abbr in cell_text:
                     column_to_day[col_idx] = day
                     break
         
@@ -69,17 +128,17 @@ def extract_opening_hours(html: str) -> Dict[str, List[str]]:
         
         # Extrahiere Zeiteinträge aus Datensätzen (Zeilen ab Zeile 1)
         for row_idx, row in enumerate(rows[1:], start=1):
-            cells = row.find_all(['th', 'td'])
+            cells = CELLS(row)
             
             for col_idx, cell in enumerate(cells):
-                if col_idx not in column_to_day:
+                day = column_to_day.get(col_idx)
+                if day is None:
                     continue
-                
-                day = column_to_day[col_idx]
+                day_hours = opening_hours[day]
                 
                 # Extrahiere ALLE Einträge aus dieser Zelle
                 # Strategie: Suche nach Zeitmuster "HH:MM - HH:MM"
-                cell_text = cell.get_text(separator='\n', strip=True)
+                cell_text = _text(cell, '\n')
                 
                 if not cell_text or cell_text.lower() == 'geschlossen':
                     continue
@@ -89,42 +148,44 @@ def extract_opening_hours(html: str) -> Dict[str, List[str]]:
                 
                 for entry in entries:
                     # Validiere: Beginnt mit Zeitformat oder ist Beschreibung für vorherige Zeit
-                    if entry and not entry.lower().startswith('nur') and not entry.lower().startswith('inklusive'):
-                        opening_hours[day].append(entry)
+                    if entry and not entry.lower().startswith(DESCRIPTION_PREFIXES):
+                        day_hours.append(entry)
     
     return opening_hours
 
 
-def extract_opening_hours_alternative(html: str) -> Dict[str, List[str]]:
+def extract_opening_hours_alternative(html: str, tree=None) -> Dict[str, List[str]]:
     """
     Alternative Methode: Direkter Zugriff auf Zellen mit Wochentag-Spalte.
     Verwendet Regex nur für Zeitformat-Validierung, KEINE Extraktionsmethode.
+    tree wie bei extract_opening_hours().
     """
-    import re
-    
-    soup = BeautifulSoup(html, 'html.parser')
-    weekdays = ['Montag', 'Dienstag', 'Mittwoch', 'Donnerstag', 'Freitag', 'Samstag', 'Sonntag']
+    if tree is None:
+        tree = parse_tables(html)
+    weekdays = WEEKDAYS
     opening_hours = {day: [] for day in weekdays}
     
     # Finde die Öffnungszeiten-Tabelle (annahme: erste Tabelle mit 7 Spalten oder ähnlich)
-    tables = soup.find_all('table')
+    tables = TABLES(tree) if tree is not None else []
     
     for table in tables:
-        rows = table.find_all('tr')
+        rows = ROWS(table)
         
         if not rows:
             continue
         
         # Heuristische Prüfung: Tabelle mit Wochentagen
-        all_cells = rows[0].find_all(['th', 'td'])
+        all_cells = CELLS(rows[0])
         
         if len(all_cells) < 7:
             continue
         
         # Versuche Header zu ermitteln
-        header_text = ' '.join(cell.get_text(strip=True) for cell in all_cells)
+        # Kopfzellen nur einmal durchlaufen; Texte dienen Prüfung und Spaltenzuordnung
+        header_cell_texts = [_text(cell) for cell in all_cells]
+        header_text = ' '.join(header_cell_texts).lower()
         
-        if not any(day.lower()[:2] in header_text.lower() for day in weekdays):
+        if not any(abbr in header_text for abbr in WEEKDAY_ABBR2):
             continue
         
         # ============ STRUKTURELLE EXTRAKTION ============
@@ -132,11 +193,10 @@ def extract_opening_hours_alternative(html: str) -> Dict[str, List[str]]:
         # Finde Spalten-Indizes für jeden Wochentag
         column_mapping = {}
         
-        for col_idx, cell in enumerate(all_cells):
-            cell_text = cell.get_text(strip=True).lower()
+        for col_idx, cell_text in enumerate(header_cell_texts):
+            cell_text = cell_text.lower()
             
-            for day in weekdays:
-                day_abbr = day.lower()[:2]  # "mo", "di", "mi", etc.
+            for day, day_abbr in zip(weekdays, WEEKDAY_ABBR2):  # "mo", "di", "mi", etc.
                 if day_abbr in cell_text:
                     column_mapping[day] = col_idx
                     break
@@ -149,42 +209,33 @@ def extract_opening_hours_alternative(html: str) -> Dict[str, List[str]]:
         
         # Extrahiere aus allen Datenzeilen (ab Zeile 1)
         for row in rows[1:]:
-            cells = row.find_all(['th', 'td'])
+            cells = CELLS(row)
             
             for day, col_idx in column_mapping.items():
                 if col_idx >= len(cells):
                     continue
                 
                 cell = cells[col_idx]
+                day_hours = opening_hours[day]
                 
                 # Hole ALLE Text-Knoten aus der Zelle
                 # Wichtig: Nicht nur .get_text(), sondern iteriere über direkte Children
-                texts = []
-                
-                for content in cell.children:
-                    if isinstance(content, str):
-                        text = content.strip()
-                        if text:
-                            texts.append(text)
-                    elif hasattr(content, 'get_text'):
-                        text = content.get_text(strip=True)
-                        if text:
-                            texts.append(text)
+                texts = _children_texts(cell)
                 
                 # Wenn keine texte via children, nutze get_text mit Separator
                 if not texts:
-                    full_text = cell.get_text(separator='\n', strip=True)
+                    full_text = _text(cell, '\n')
                     if full_text:
                         texts = [t.strip() for t in full_text.split('\n') if t.strip()]
                 
                 # Filtere und validiere Einträge
                 for text in texts:
-                    if text.lower() in ['geschlossen', '-', 'ruhetag']:
+                    if text.lower() in NO_HOURS_TEXTS:
                         continue
                     
                     # Nur hinzufügen wenn Text nicht leer und nicht bloß Beschreibung
                     if text:
-                        opening_hours[day].append(text)
+                        day_hours.append(text)
     
     return opening_hours
 
@@ -199,9 +250,11 @@ if __name__ == '__main__':
         response = requests.get(url, timeout=10)
         response.encoding = 'utf-8'
         html = response.text
+        # Einmal parsen, beide Methoden arbeiten auf demselben Baum
+        tree = parse_tables(html)
         
         # Methode 1
-        hours_1 = extract_opening_hours(html)
+        hours_1 = extract_opening_hours(html, tree)
         
         print("=== METHODE 1: Basis-Strukturanalyse ===")
         for day, times in hours_1.items():
@@ -215,7 +268,7 @@ if __name__ == '__main__':
         print("\n" + "="*50 + "\n")
         
         # Methode 2
-        hours_2 = extract_opening_hours_alternative(html)
+        hours_2 = extract_opening_hours_alternative(html, tree)
         
         print("=== METHODE 2: Alternative Strukturanalyse ===")
         for day, times in hours_2.items():
@@ -1,16 +1,18 @@
 #!/usr/bin/env python3
-import subprocess
-import sys
 import os
+import subprocess
+
+import orjson
+
+from scraper import scrape_pools
 
 os.chdir('/workspaces/BBB')
 
 print("🔄 Rescraping pools with improved parser...")
-result = subprocess.run([sys.executable, 'scraper/scrape_pools.py', '--file', 'urls.txt'], check=True)
+scrape_pools.main(['--file', 'urls.txt'])
 
 print("✅ Validating JSON...")
-result = subprocess.run([sys.executable, '-m', 'json.tool', 'data/pools.json'], 
-                       stdout=subprocess.DEVNULL, check=True)
+orjson.loads(scrape_pools.DATA_PATH.read_bytes())
 
 print("📤 Pushing to GitHub...")
 subprocess.run(['git', 'add', '-A'], check=True)
@@ -1,53 +1,50 @@
 #!/usr/bin/env python3
 """Rescrape with fixed parser and plausibility checks."""
 
-import subprocess
 from pathlib import Path
 
+import clean_with_check
+from scraper import scrape_pools
+
 base = Path(__file__).resolve().parent
 urls_file = base / "urls.txt"
 
-if not urls_file.exists():
-    print(f"❌ {urls_file} not found")
-    exit(1)
-
-urls = [line.strip() for line in urls_file.read_text(encoding="utf-8").splitlines() if line.strip()]
 
-if not urls:
-    print("❌ No URLs found")
-    exit(1)
+def main():
+    if not urls_file.exists():
+        print(f"❌ {urls_file} not found")
+        exit(1)
 
-print(f"Rescraping {len(urls)} pools with FIXED parser...\n")
+    urls = [line.strip() for line in urls_file.read_text(encoding="utf-8").splitlines() if line.strip()]
 
-# Run FIXED scraper (copy fixed version to main location)
-import shutil
-fixed_scraper = base / "scraper" / "scrape_pools_fixed.py"
-main_scraper = base / "scraper" / "scrape_pools.py"
+    if not urls:
+        print("❌ No URLs found")
+        exit(1)
 
-if fixed_scraper.exists():
-    print(f"Copying fixed scraper to main location...")
-    shutil.copy(fixed_scraper, main_scraper)
+    print(f"Rescraping {len(urls)} pools with FIXED parser...\n")
 
-result = subprocess.run(
-    ["python3", "scraper/scrape_pools.py"] + urls,
-    cwd=base
-)
+    # scraper/scrape_pools.py is the fixed parser
+    try:
+        scrape_pools.write_json(scrape_pools.scrape(urls))
+    except Exception as e:
+        print(f"❌ Scraper failed: {e}")
+        exit(1)
 
-if result.returncode != 0:
-    print("❌ Scraper failed")
-    exit(1)
+    print("\n" + "="*70)
+    print("Scraping complete. Running plausibility cleaner...")
+    print("="*70 + "\n")
 
-print("\n" + "="*70)
-print("Scraping complete. Running plausibility cleaner...")
-print("="*70 + "\n")
+    try:
+        clean_with_check.main()
+    except Exception as e:
+        print(f"❌ Cleaner failed: {e}")
+        exit(1)
 
-result = subprocess.run(["python3", "clean_with_check.py"], cwd=base)
+    print("\n" + "="*70)
+    print("✅ All done! Ready to deploy.")
+    print("="*70)
+    print("\nNext: git add -A && git commit && git push")
 
-if result.returncode != 0:
-    print("❌ Cleaner failed")
-    exit(1)
 
-print("\n" + "="*70)
-print("✅ All done! Ready to deploy.")
-print("="*70)
-print("\nNext: git add -A && git commit && git push")
+if __name__ == "__main__":
+    main()
@@ -5,43 +5,51 @@ This script fetches all pools fresh and applies the new structured parsing.
 """
 
 import sys
-import subprocess
 from pathlib import Path
 
+import clean_data
+from scraper import scrape_pools
+
 # Get list of URLs
 urls_file = Path(__file__).resolve().parent / "urls.txt"
 
-if not urls_file.exists():
-    print(f"Error: {urls_file} not found")
-    sys.exit(1)
 
-urls = [line.strip() for line in urls_file.read_text(encoding="utf-8").splitlines() if line.strip()]
+def main():
+    if not urls_file.exists():
+        print(f"Error: {urls_file} not found")
+        sys.exit(1)
+
+    urls = [line.strip() for line in urls_file.read_text(encoding="utf-8").splitlines() if line.strip()]
 
-if not urls:
-    print("No URLs found in urls.txt")
-    sys.exit(1)
+    if not urls:
+        print("No URLs found in urls.txt")
+        sys.exit(1)
 
-print(f"Rescraping {len(urls)} pools with improved parser...\n")
+    print(f"Rescraping {len(urls)} pools with improved parser...\n")
 
-# Run scraper
-cmd = ["python3", "scraper/scrape_pools.py"] + urls
-result = subprocess.run(cmd, cwd=Path(__file__).resolve().parent)
+    # Run scraper
+    try:
+        pools = scrape_pools.scrape(urls)
+        scrape_pools.write_json(pools)
+    except Exception as e:
+        print(f"Scraper failed: {e}")
+        sys.exit(1)
 
-if result.returncode != 0:
-    print(f"Scraper failed with exit code {result.returncode}")
-    sys.exit(1)
+    print("\n" + "="*60)
+    print("Scraping complete. Now cleaning data...")
+    print("="*60 + "\n")
 
-print("\n" + "="*60)
-print("Scraping complete. Now cleaning data...")
-print("="*60 + "\n")
+    # Run cleaner on the pools in memory
+    try:
+        clean_data.main(pools)
+    except Exception as e:
+        print(f"Cleaner failed: {e}")
+        sys.exit(1)
 
-# Run cleaner
-cmd = ["python3", "clean_data_new.py"]
-result = subprocess.run(cmd, cwd=Path(__file__).resolve().parent)
+    print("\n✅ All done! Data is clean and ready.")
+    print("\nNext: git add -A && git commit -m 'fix: improve parser with structured HTML selection' && git push")
 
-if result.returncode != 0:
-    print(f"Cleaner failed with exit code {result.returncode}")
-    sys.exit(1)
 
-print("\n✅ All done! Data is clean and ready.")
-print("\nNext: git add -A && git commit -m 'fix: improve parser with structured HTML selection' && git push")
+# Guarded: clean_data's worker processes may re-import this module
+if __name__ == "__main__":
+    main()
@@ -3,17 +3,29 @@
 from __future__ import annotations
 
 import argparse
-import json
+import os
 import re
+import time
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
+import orjson
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 DATA_PATH = Path(__file__).resolve().parents[1] / "data" / "pools.json"
 DATA_PATH.parent.mkdir(parents=True, exist_ok=True)
+# Results of the run in progress, one JSON object per line; removed once they
+# are written to pools.json, so a leftover file means a run was interrupted
+PARTIAL_PATH = DATA_PATH.with_suffix(".partial.jsonl")
+# An older leftover is from an abandoned run and is not resumed
+PARTIAL_MAX_AGE = 3600  # seconds
 
 WEEKDAYS = [
     "Montag",
@@ -25,32 +37,98 @@ WEEKDAYS = [
     "Sonntag",
 ]
 
+# Compiled once at import instead of per weekday / per entry
+_WS_RE = re.compile(r"\s+")
+# HH:MM - HH:MM followed by "Uhr" and a short description
+_TIME_ENTRY_RE = re.compile(
+    r"(\d{1,2}:\d{2}\s*[-–]\s*\d{1,2}:\d{2}(?:\s+[Uu]hr)?(?:\s+[^;,\n]{0,80})?)",
+    re.IGNORECASE,
+)
+_CLOSED_RE = re.compile("geschlossen", re.IGNORECASE)
+# Start of the opening-hours section ("Öffnungszeiten", "öffnungszeit", ...)
+_HOURS_LABEL_RE = re.compile("öffnung", re.IGNORECASE)
+# One capture group per weekday, so m.lastindex - 1 is its WEEKDAYS index
+_DAY_RE = re.compile(r"\b(?:" + "|".join(f"({wd})" for wd in WEEKDAYS) + r")\b", re.IGNORECASE)
 
-def fetch_page(url: str, timeout: int = 10) -> str:
-    resp = requests.get(url, timeout=timeout)
-    resp.raise_for_status()
-    resp.encoding = resp.apparent_encoding
-    return resp.text
+# parse_pool only reads the first <h1> and the page text, so it queries the
+# lxml tree directly instead of wrapping it in a BeautifulSoup object model.
+# Text nodes exclude <script>/<style> content, as soup.get_text() does.
+FIRST_H1 = etree.XPath("(//h1)[1]")
+TEXT_NODES = etree.XPath("//text()[not(parent::script or parent::style)]")
+NODE_TEXTS = etree.XPath(".//text()[not(parent::script or parent::style)]")
 
+# Concurrent page fetches; stays below the session's pool_maxsize
+MAX_WORKERS = 8
+# Upper bound on the body read per page; the detail pages are far smaller
+MAX_PAGE_BYTES = 2 * 1024 * 1024
 
-def extract_text_near_label(soup: BeautifulSoup, label_keywords: List[str]) -> str:
-    """Find element containing keywords and return nearby text."""
-    for kw in label_keywords:
-        found = soup.find(string=lambda s: s and kw.lower() in s.lower())
-        if found:
-            parent = found.parent
-            for sib in parent.find_next_siblings(limit=5):
-                text = sib.get_text(separator=" ", strip=True)
-                if text:
-                    return text
-            return parent.get_text(separator=" ", strip=True)
-    return soup.get_text(separator=" ", strip=True)[:1000]
+# One keep-alive session for all pages: every URL is on the same host, so the
+# TCP connect and TLS handshake are paid once per run instead of once per page.
+# Dropped connections are retried with a short backoff on the same pool.
+SESSION = requests.Session()
+SESSION.headers["User-Agent"] = f"{requests.utils.default_user_agent()} bbb-pool-scraper"
+_ADAPTER = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.3),
+)
+SESSION.mount("https://", _ADAPTER)
+SESSION.mount("http://", _ADAPTER)
+
+
+def fetch_page(url: str, timeout: int = 10) -> Tuple[bytes, str]:
+    """Return the raw body and its charset.
+
+    The body stays bytes: lxml decodes it in C while parsing, so there is no
+    separate decode to str that lxml would re-encode internally.
+    """
+    # Streamed, so a non-HTML or runaway response is rejected/cut off before
+    # its whole body has been downloaded
+    with SESSION.get(url, timeout=timeout, stream=True) as resp:
+        resp.raise_for_status()
+        content_type = resp.headers.get("Content-Type", "").lower()
+        if content_type and "html" not in content_type:
+            raise ValueError(f"not an HTML page: {content_type}")
+        buf = bytearray()
+        for chunk in resp.iter_content(chunk_size=65536):
+            buf += chunk
+            if len(buf) >= MAX_PAGE_BYTES:
+                break
+        body = bytes(buf[:MAX_PAGE_BYTES])
+        # Trust the charset from Content-Type; apparent_encoding runs chardet over
+        # the whole body. requests falls back to ISO-8859-1 for text/* without a
+        # charset, which would garble umlauts, so default to UTF-8 in that case.
+        if "charset" not in content_type:
+            return body, "utf-8"
+        return body, resp.encoding
+
+
+def _collapsed_before(text: str, end: int, n: int) -> str:
+    """Last n characters of _WS_RE.sub(' ', text[:end]), collapsing only that tail."""
+    width = n
+    while True:
+        start = max(0, end - width)
+        out = _WS_RE.sub(" ", text[start:end])
+        if len(out) >= n or start == 0:
+            return out[-n:]
+        width *= 2
+
+
+def _collapsed_from(text: str, start: int, n: int) -> str:
+    """First n characters of _WS_RE.sub(' ', text[start:]), collapsing only that head."""
+    width = n
+    while True:
+        end = min(len(text), start + width)
+        out = _WS_RE.sub(" ", text[start:end])
+        if len(out) >= n or end == len(text):
+            return out[:n]
+        width *= 2
 
 
 def parse_pool(url: str) -> Dict:
     """Parse pool hours from website using aggressive text extraction."""
     try:
-        html = fetch_page(url)
+        html, encoding = fetch_page(url)
     except Exception as e:
         return {
             "name": "(failed to fetch)",
@@ -60,100 +138,105 @@ def parse_pool(url: str) -> Dict:
             "error": str(e),
         }
 
-    soup = BeautifulSoup(html, "html.parser")
+    try:
+        parser = lxml_html.HTMLParser(encoding=encoding)
+    except LookupError:  # unknown charset name in Content-Type
+        parser = lxml_html.HTMLParser(encoding="utf-8")
+    try:
+        # One parser per call: lxml parsers must not be shared across threads
+        tree = lxml_html.fromstring(html, parser=parser)
+    except etree.ParserError:  # empty document, e.g. only whitespace or a comment
+        tree = None
 
     # Extract name
     name = None
-    h1 = soup.find("h1")
+    h1 = FIRST_H1(tree) if tree is not None else None
     if h1:
-        name = h1.get_text(strip=True)
+        name = "".join(t.strip() for t in NODE_TEXTS(h1[0]))
     if not name:
         name = url.split("/")[-2] if url.endswith("/") else url.split("/")[-1]
 
     hours: Dict[str, List[str]] = {wd: [] for wd in WEEKDAYS}
 
-    # Get ALL text and normalize
-    full_text = soup.get_text(separator=" ", strip=True)
-    full_text = re.sub(r'\s+', ' ', full_text)
+    # Get ALL text
+    texts = TEXT_NODES(tree) if tree is not None else []
+    full_text = " ".join(t for t in (t.strip() for t in texts) if t)
     
-    # Find opening hours section
-    hours_idx = full_text.lower().find('öffnung')
-    if hours_idx >= 0:
-        hours_text = full_text[max(0, hours_idx - 100):min(len(full_text), hours_idx + 5000)]
+    # Find opening hours section; searching case-insensitively avoids
+    # lowercasing a copy of the whole page text. The label holds no
+    # whitespace, so it is found at the same place before collapsing, and
+    # only the window around it (100 chars before, 5000 from the label on,
+    # counted after collapsing) has its whitespace runs normalized.
+    m = _HOURS_LABEL_RE.search(full_text)
+    if m:
+        hours_idx = m.start()
+        hours_text = _collapsed_before(full_text, hours_idx, 100) + _collapsed_from(full_text, hours_idx, 5000)
     else:
-        hours_text = full_text
+        hours_text = _WS_RE.sub(' ', full_text)
     
+    # Locate every weekday name in one scan instead of compiling and
+    # searching up to 28 patterns per page
+    day_starts: List[List[int]] = [[] for _ in WEEKDAYS]
+    # Without a colon or a "geschlossen" no day can get an entry, so pages
+    # without hours skip the weekday scan altogether
+    if ':' in hours_text or _CLOSED_RE.search(hours_text):
+        for m in _DAY_RE.finditer(hours_text):
+            day_starts[m.lastindex - 1].append(m.start())
+
     # Extract times for each weekday
     for weekday_idx, weekday in enumerate(WEEKDAYS):
-        wd_pattern = re.compile(rf'\b{weekday}\b', re.IGNORECASE)
-        match = wd_pattern.search(hours_text)
-        
-        if not match:
+        if not day_starts[weekday_idx]:
             continue
         
         # Find where this weekday starts
-        start_pos = match.start()
+        start_pos = day_starts[weekday_idx][0]
         
         # Find the next weekday
         end_pos = len(hours_text)
-        for future_wd in WEEKDAYS[weekday_idx + 1:]:
-            future_pattern = re.compile(rf'\b{future_wd}\b', re.IGNORECASE)
-            future_match = future_pattern.search(hours_text, start_pos + len(weekday))
-            if future_match:
-                end_pos = future_match.start()
+        for future_starts in day_starts[weekday_idx + 1:]:
+            i = bisect_left(future_starts, start_pos + len(weekday))
+            if i < len(future_starts):
+                end_pos = future_starts[i]
                 break
         
-        # Extract the chunk for this weekday
-        chunk = hours_text[start_pos:end_pos]
-        
+        # The chunk for this weekday is hours_text[start_pos:end_pos]; it is
+        # searched in place (pos/endpos) rather than copied and lowercased
+
         # Check if this section contains "Geschlossen"
-        if 'geschlossen' in chunk.lower():
+        if _CLOSED_RE.search(hours_text, start_pos, end_pos):
             hours[weekday].append("Geschlossen")
             continue
         
+        # No colon, no clock time: skip the regex for days that only mention a name
+        if hours_text.find(':', start_pos, end_pos) < 0:
+            continue
+
         # Find all times in chunk: HH:MM - HH:MM followed by description
-        time_pattern = re.compile(
-            r'(\d{1,2}:\d{2}\s*[-–]\s*\d{1,2}:\d{2}(?:\s+[Uu]hr)?(?:\s+[^;,\n]{0,80})?)',
-            re.IGNORECASE
-        )
-        
-        matches = time_pattern.findall(chunk)
-        seen = set()
+        matches = _TIME_ENTRY_RE.findall(hours_text, start_pos, end_pos)
+        # Ordered set keyed by lowercase entry, first spelling wins
+        unique: Dict[str, str] = {}
         
         for match in matches:
+            # Matches start at a clock time, so there is no weekday prefix to
+            # strip, and hours_text is already whitespace-collapsed. The pattern
+            # bounds a match to well under 150 characters that always start with
+            # "H:MM-H:MM", so no length cut or re-validation is needed either.
             entry = match.strip()
             
-            # Remove leading weekday name
-            entry = re.sub(rf'^{weekday}\s*', '', entry, flags=re.IGNORECASE).strip()
-            
-            # Normalize spaces
-            entry = re.sub(r'\s+', ' ', entry)
-            
             # Ensure "Uhr" is present
             if 'uhr' not in entry.lower():
                 entry = entry.rstrip('.,:;') + ' Uhr'
             
-            # Clean trailing junk
-            entry = re.sub(r'[,;\.]+\s*$', '', entry)
-            
-            # Limit length at word boundary
-            if len(entry) > 150:
-                words = entry.split()
-                truncated = []
-                length = 0
-                for word in words:
-                    if length + len(word) + 1 > 150:
-                        break
-                    truncated.append(word)
-                    length += len(word) + 1
-                entry = ' '.join(truncated)
+            # Clean trailing junk: the run of , ; . before any trailing
+            # whitespace goes, together with that whitespace
+            trimmed = entry.rstrip()
+            if trimmed.endswith((',', ';', '.')):
+                entry = trimmed.rstrip(',;.')
             
-            # Validate and deduplicate
-            if len(entry) >= 10 and re.search(r'\d{1,2}:\d{2}', entry):
-                entry_lower = entry.lower()
-                if entry_lower not in seen:
-                    seen.add(entry_lower)
-                    hours[weekday].append(entry)
+            # Deduplicate
+            unique.setdefault(entry.lower(), entry)
+
+        hours[weekday] = list(unique.values())
 
     return {
         "name": name,
@@ -164,15 +247,85 @@ def parse_pool(url: str) -> Dict:
 
 
 def write_json(data: List[Dict]) -> None:
-    with DATA_PATH.open("w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    # Same layout as json.dump(..., ensure_ascii=False, indent=2), encoded in Rust.
+    # Written next to the target and renamed over it, so the API never reads a
+    # half-written pools.json.
+    tmp = DATA_PATH.with_suffix(".json.tmp")
+    tmp.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    os.replace(tmp, DATA_PATH)
+    # The run's results are safely in pools.json now; nothing left to resume
+    PARTIAL_PATH.unlink(missing_ok=True)
+
+
+def _scrape_one(url: str) -> Dict:
+    print(f"Fetching {url}...")
+    try:
+        return parse_pool(url)
+    except Exception as e:
+        return {
+            "name": "(error)",
+            "hours": {wd: [] for wd in WEEKDAYS},
+            "source_url": url,
+            "fetched_at": datetime.now(timezone.utc).isoformat(),
+            "error": str(e),
+        }
+
+
+def _load_partial() -> Dict[str, Dict]:
+    """Successful results of a recently interrupted run, keyed by source_url."""
+    try:
+        age = time.time() - PARTIAL_PATH.stat().st_mtime
+    except FileNotFoundError:
+        return {}
+    if age > PARTIAL_MAX_AGE:
+        return {}
+    done = {}
+    for line in PARTIAL_PATH.read_bytes().splitlines():
+        try:
+            rec = orjson.loads(line)
+        except orjson.JSONDecodeError:
+            continue  # line torn by an interruption
+        if "error" not in rec:
+            done[rec["source_url"]] = rec
+    return done
 
 
-def main() -> None:
+def scrape(urls: List[str]) -> List[Dict]:
+    """Fetch and parse every URL; failed pages become "(error)" records.
+
+    Pages are fetched concurrently (the threads mostly wait on sockets);
+    results keep the order of urls. Each result is appended to PARTIAL_PATH
+    as it arrives, and a rerun after an interruption only fetches the URLs
+    that had no successful result yet. PARTIAL_PATH is removed by
+    write_json() once the results are in pools.json.
+    """
+    done = _load_partial()
+    todo = [url for url in urls if url not in done]
+    if done:
+        print(f"Resuming: {len(urls) - len(todo)} of {len(urls)} pages from {PARTIAL_PATH.name}")
+        # Cut a torn last line back to the last newline, so the first new
+        # record does not get glued onto it
+        with PARTIAL_PATH.open("r+b") as partial:
+            partial.truncate(partial.read().rfind(b"\n") + 1)
+    fresh = []
+    with PARTIAL_PATH.open("ab" if done else "wb") as partial:
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+            for res in ex.map(_scrape_one, todo):
+                partial.write(orjson.dumps(res) + b"\n")
+                partial.flush()
+                # On disk before the next page, so a crash or power loss
+                # keeps every finished page
+                os.fsync(partial.fileno())
+                fresh.append(res)
+    fresh_iter = iter(fresh)
+    return [done[url] if url in done else next(fresh_iter) for url in urls]
+
+
+def main(argv: List[str] | None = None) -> None:
     parser = argparse.ArgumentParser(description="Scrape pool pages")
     parser.add_argument("urls", nargs="*", help="Pool URLs")
     parser.add_argument("--file", help="File with URLs")
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     urls: List[str] = list(args.urls or [])
     if args.file:
@@ -184,21 +337,7 @@ def main() -> None:
         print("No URLs provided.")
         return
 
-    results = []
-    for url in urls:
-        print(f"Fetching {url}...")
-        try:
-            res = parse_pool(url)
-            results.append(res)
-        except Exception as e:
-            results.append({
-                "name": "(error)",
-                "hours": {wd: [] for wd in WEEKDAYS},
-                "source_url": url,
-                "fetched_at": datetime.now(timezone.utc).isoformat(),
-                "error": str(e),
-            })
-
+    results = scrape(urls)
     write_json(results)
     print(f"✅ Wrote {len(results)} pools to {DATA_PATH}")
 